@@ -10,7 +10,7 @@ class BandPanel(pyg.Panel):
         super().__init__(name)
 
         # define edge loop
-        self.edges = pyg.esf.from_verts([0,0], [0, depth], [width, depth], [width, 0], loop=True)
+        self.edges = pyg.esf.rect_loop(width, depth)
 
         # define interface
         self.interfaces = {
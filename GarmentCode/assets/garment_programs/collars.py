@@ -1,4 +1,4 @@
-import numpy as np
+import math
 from scipy.spatial.transform import Rotation as R
 
 # Custom
@@ -14,7 +14,7 @@ from .circle_skirt import CircleArcPanel
 def VNeckHalf(depth, width, **kwargs):
     """Simple VNeck design"""
 
-    edges = pyg.EdgeSequence(pyg.Edge([0, 0], [width / 2,-depth]))
+    edges = pyg.EdgeSequence.single(pyg.Edge([0, 0], [width / 2,-depth]))
     
     return edges
 
@@ -35,9 +35,9 @@ def TrapezoidNeckHalf(depth, width, angle=90, **kwargs):
         # degrades into VNeck
         return VNeckHalf(depth, width)
 
-    angle = np.deg2rad(angle)
+    angle = math.radians(angle)
 
-    edges = pyg.esf.from_verts([0, 0], [-depth * np.cos(angle) / np.sin(angle), -depth], [width / 2, -depth])
+    edges = pyg.esf.from_verts([0, 0], [-depth * math.cos(angle) / math.sin(angle), -depth], [width / 2, -depth])
 
     return edges
 
@@ -47,7 +47,7 @@ def CurvyNeckHalf(depth, width, flip=False, **kwargs):
     """Testing Curvy Collar design"""
 
     sign = -1 if flip else 1
-    edges = pyg.EdgeSequence(pyg.CurveEdge(
+    edges = pyg.EdgeSequence.single(pyg.CurveEdge(
         [0, 0], [width / 2,-depth], 
         [[0.4, sign * 0.3], [0.8, sign * -0.3]]))
     
@@ -57,8 +57,8 @@ def CurvyNeckHalf(depth, width, flip=False, **kwargs):
 def CircleArcNeckHalf(depth, width, angle=90, flip=False, **kwargs):
     """Collar with a side represented by a circle arc"""
     # 1/4 of a circle
-    edges = pyg.EdgeSequence(pyg.CircleEdge.from_points_angle(
-        [0, 0], [width / 2,-depth], arc_angle=np.deg2rad(angle),
+    edges = pyg.EdgeSequence.single(pyg.CircleEdge.from_points_angle(
+        [0, 0], [width / 2,-depth], arc_angle=math.radians(angle),
         right=(not flip)
     ))
 
@@ -72,11 +72,27 @@ def CircleNeckHalf(depth, width, **kwargs):
 
     subdiv = circle.subdivide_len([0.5, 0.5])
 
-    return pyg.EdgeSequence(subdiv[0])
+    return pyg.EdgeSequence.single(subdiv[0])
+
+
+# Collar shapes available by name in design parameters
+_COLLAR_SHAPES = {
+    'VNeckHalf': VNeckHalf,
+    'SquareNeckHalf': SquareNeckHalf,
+    'TrapezoidNeckHalf': TrapezoidNeckHalf,
+    'CurvyNeckHalf': CurvyNeckHalf,
+    'CircleArcNeckHalf': CircleArcNeckHalf,
+    'CircleNeckHalf': CircleNeckHalf,
+}
 
 
 # # ------ Collars with panels ------
 
+# Placement of the curved back panel of SimpleLapel
+# NOTE: scipy rotations are not modified in-place, so it's safe to share the object
+_LAPEL_BACK_ROT = R.from_euler('XYZ', [90, 45, 0], degrees=True)
+
+
 class NoPanelsCollar(pyg.Component):
     """Face collar class that only only forms the projected shapes """
     
@@ -84,7 +100,7 @@ class NoPanelsCollar(pyg.Component):
         super().__init__(name)
 
         # Front
-        collar_type = globals()[design['collar']['f_collar']['v']]
+        collar_type = _COLLAR_SHAPES[design['collar']['f_collar']['v']]
         f_collar = collar_type(
             design['collar']['fc_depth']['v'],
             design['collar']['width']['v'], 
@@ -92,7 +108,7 @@ class NoPanelsCollar(pyg.Component):
             flip=design['collar']['f_flip_curve']['v'])
 
         # Back
-        collar_type = globals()[design['collar']['b_collar']['v']]
+        collar_type = _COLLAR_SHAPES[design['collar']['b_collar']['v']]
         b_collar = collar_type(
             design['collar']['bc_depth']['v'], 
             design['collar']['width']['v'], 
@@ -181,7 +197,7 @@ class SimpleLapel(pyg.Component):
 
         # --Projecting shapes--
         # Any front one!
-        collar_type = globals()[design['collar']['f_collar']['v']]
+        collar_type = _COLLAR_SHAPES[design['collar']['f_collar']['v']]
         f_collar = collar_type(
             design['collar']['fc_depth']['v'],
             design['collar']['width']['v'], 
@@ -212,21 +228,26 @@ class SimpleLapel(pyg.Component):
             rad, angle, _ = b_collar[0].as_radius_angle()
             self.back = CircleArcPanel(
                 f'{tag}_lapel_back', rad, depth, angle  
-            ).translate_by([-length_b, height_p, -10])
-            self.back.rotate_by(R.from_euler('XYZ', [90, 45, 0], degrees=True))
+            ).transform_by(
+                [-length_b, height_p, -10], 
+                _LAPEL_BACK_ROT)
+
 
+        # Back panel interfaces to use: (to front, back, bottom)
+        iface_in, iface_out, iface_bottom = (
+            ('right', 'left', 'bottom') if standing else ('left', 'right', 'top'))
 
         self.stitching_rules.append((
             self.front.interfaces['to_collar'], 
-            self.back.interfaces['right'] if standing else self.back.interfaces['left']
+            self.back.interfaces[iface_in]
         ))
 
         self.interfaces.update({
             #'front': NOTE: no front interface here
-            'back': self.back.interfaces['left'] if standing else self.back.interfaces['right'],
+            'back': self.back.interfaces[iface_out],
             'bottom': pyg.Interface.from_multiple(
                 self.front.interfaces['to_bodice'],
-                self.back.interfaces['bottom'] if standing else self.back.interfaces['top'],
+                self.back.interfaces[iface_bottom],
             )
         })
 
@@ -1,5 +1,6 @@
-import svgpathtools as svgpath
 from copy import deepcopy
+from argparse import Namespace
+import numpy as np
 
 # Custom
 import pygarment as pyg
@@ -8,52 +9,66 @@ import pygarment as pyg
 from . import bands
 
 
+def pant_measures(body, design):
+    """Body-dependent measurements of a pant panel
+        (shared by all the panels of the pants)
+    """
+    pant_width = design['width']['v'] * body['hips'] / 4
+    hips_depth = body['hips_line']
+    waist = body['waist'] / 4
+
+    # amount of extra fabric at waist
+    w_diff = pant_width - waist   # Assume its positive since waist is smaller then hips
+
+    return Namespace(
+        pant_width=pant_width,
+        low_width=pant_width * design['flare']['v'],
+        length=design['length']['v'] * body['leg_length'],
+        waist=waist,
+        hips_depth=hips_depth,
+        dart_position=body['bust_points'] / 2,
+        dart_depth=hips_depth * 0.8,
+        # Crotch cotrols
+        crotch_depth_diff=body['crotch_hip_diff'],
+        crotch_extention=body['leg_circ'] / 2 - body['hips'] / 4,
+        w_diff=w_diff,
+        # We distribute w_diff among the side angle and a dart 
+        hw_shift=w_diff / 3,
+    )
+
+
 class PantPanel(pyg.Panel):
-    def __init__(self, name, body, design) -> None:
+    def __init__(self, name, body, design, measures=None) -> None:
         """
             Basic pant panel with option to be fitted (with darts) or ruffled at waist area.
+
+            * measures -- precomputed pant_measures(body, design),
+                allows to share them between the panels of the same garment
         """
         super().__init__(name)
 
-        pant_width = design['width']['v'] * body['hips'] / 4
-        low_width = pant_width * design['flare']['v']  
-        length = design['length']['v'] * body['leg_length']
-
-        waist = body['waist'] / 4
-        hips_depth = body['hips_line']
-        dart_position = body['bust_points'] / 2
-        dart_depth = hips_depth * 0.8 
-
-        # Crotch cotrols
-        crotch_depth_diff =  body['crotch_hip_diff']
-        crotch_extention = body['leg_circ'] / 2 - body['hips'] / 4
-
-        # eval pants shape
-        # amount of extra fabric at waist
-        w_diff = pant_width - waist   # Assume its positive since waist is smaller then hips
-        # We distribute w_diff among the side angle and a dart 
-        hw_shift = w_diff / 3
+        m = measures if measures is not None else pant_measures(body, design)
 
         right = pyg.esf.curve_3_points(
             [
-                min(- (low_width - pant_width), (pant_width - low_width) / 2),   # extend wide pants out
+                min(- (m.low_width - m.pant_width), (m.pant_width - m.low_width) / 2),   # extend wide pants out
                 0
             ],    
             [
-                hw_shift, 
-                length + hips_depth
+                m.hw_shift, 
+                m.length + m.hips_depth
             ],
-            target=[0, length]
+            target=[0, m.length]
         )
 
         top = pyg.Edge(
             right.end, 
-            [w_diff + waist, length + hips_depth] 
+            [m.w_diff + m.waist, m.length + m.hips_depth] 
         )
 
         crotch = pyg.CurveEdge(
             top.end,
-            [pant_width + crotch_extention, length - crotch_depth_diff], 
+            [m.pant_width + m.crotch_extention, m.length - m.crotch_depth_diff], 
             [[0.9, -0.3]]    # NOTE: relative contols allow adaptation to different bodies
         )
 
@@ -61,23 +76,23 @@ class PantPanel(pyg.Panel):
         # NOTE applying rise here for correctly collecting the edges
         rise = design['rise']['v']
         if not pyg.utils.close_enough(rise, 1.):
-            new_level = top.end[1] - (1 - rise) * hips_depth
+            new_level = top.end[1] - (1 - rise) * m.hips_depth
             right, top, crotch = self.apply_rise(new_level, right, top, crotch)
 
         left = pyg.CurveEdge(
             crotch.end,
             [
-                min(pant_width, pant_width - (pant_width - low_width) / 2), 
-                min(0, length - crotch_depth_diff)], 
+                min(m.pant_width, m.pant_width - (m.pant_width - m.low_width) / 2), 
+                min(0, m.length - m.crotch_depth_diff)], 
             [[0.2, -0.1]]
         )
 
-        self.edges = pyg.EdgeSequence(right, top, crotch, left).close_loop()
+        self.edges = pyg.EdgeSequence.closed(right, top, crotch, left)
         bottom = self.edges[-1]
 
         # Default placement
         self.set_pivot(crotch.end)
-        self.translation = [-0.5, - hips_depth - crotch_depth_diff + 5, 0] 
+        self.translation = [-0.5, - m.hips_depth - m.crotch_depth_diff + 5, 0] 
 
         # Out interfaces (easier to define before adding a dart)
         self.interfaces = {
@@ -88,10 +103,10 @@ class PantPanel(pyg.Panel):
         }
 
         # Add top dart 
-        dart_width = w_diff - hw_shift
-        dart_shape = pyg.esf.dart_shape(dart_width, dart_depth)
+        dart_width = m.w_diff - m.hw_shift
+        dart_shape = pyg.esf.dart_shape(dart_width, m.dart_depth)
         top_edges, dart_edges, int_edges = pyg.ops.cut_into_edge(
-            dart_shape, top, offset=(hw_shift + waist - dart_position), right=True)
+            dart_shape, top, offset=(m.hw_shift + m.waist - m.dart_position), right=True)
 
         self.edges.substitute(top, top_edges)
         self.stitching_rules.append((pyg.Interface(self, dart_edges[0]), pyg.Interface(self, dart_edges[1])))
@@ -100,16 +115,19 @@ class PantPanel(pyg.Panel):
 
     def apply_rise(self, level, right, top, crotch):
 
-        right_c, crotch_c = right.as_curve(), crotch.as_curve()
-        cutout = svgpath.Line(0 + 1j*level, crotch.end[0] + 1j*level)
-
-        right_intersect = right_c.intersect(cutout)[0]
-        right_cut = right_c.cropped(0, right_intersect[0])
-        new_right = pyg.CurveEdge.from_svg_curve(right_cut)
+        # NOTE: Cut the curves with the horizontal line analytically 
+        # on their control polygons
+        right_cps = pyg.utils.c_to_np(right.as_curve().bpoints())
+        right_cut, _ = _bezier_split(right_cps, _bezier_y_root(right_cps, level))
+        new_right = pyg.CurveEdge(
+            right_cut[0].tolist(), right_cut[-1].tolist(), 
+            right_cut[1:-1].tolist(), relative=False)
 
-        c_intersect = crotch_c.intersect(cutout)[0]
-        c_cut = crotch_c.cropped(c_intersect[0], 1)
-        new_crotch = pyg.CurveEdge.from_svg_curve(c_cut)
+        crotch_cps = pyg.utils.c_to_np(crotch.as_curve().bpoints())
+        _, c_cut = _bezier_split(crotch_cps, _bezier_y_root(crotch_cps, level))
+        new_crotch = pyg.CurveEdge(
+            c_cut[0].tolist(), c_cut[-1].tolist(), 
+            c_cut[1:-1].tolist(), relative=False)
 
         new_top = pyg.Edge(new_right.end, new_crotch.start)
 
@@ -117,16 +135,65 @@ class PantPanel(pyg.Panel):
 
 
 
+# Utils
+def _bezier_y_root(cps, level, tol=1e-9):
+    """Parameter t of the (Quadratic or Cubic) Bezier curve given by control points cps
+        at which the curve crosses the horizontal line y = level
+    """
+    y = cps[:, 1]
+    # Power basis coefficients of y(t), highest degree first
+    if len(cps) == 3:
+        coeffs = [y[0] - 2*y[1] + y[2], 2*(y[1] - y[0]), y[0] - level]
+    else:
+        coeffs = [
+            -y[0] + 3*y[1] - 3*y[2] + y[3], 
+            3*(y[0] - 2*y[1] + y[2]), 
+            3*(y[1] - y[0]), 
+            y[0] - level]
+
+    roots = np.roots(coeffs)
+    roots = sorted(r.real for r in roots 
+                   if abs(r.imag) < tol and -tol <= r.real <= 1 + tol)
+    if not roots:
+        raise ValueError(f'PantPanel::Error::Curve does not reach the level {level}')
+
+    return min(max(roots[0], 0), 1)
+
+def _bezier_split(cps, t):
+    """Split Bezier control polygon at t with de Casteljau algorithm
+        Returns control points of the [0, t] and [t, 1] parts of the curve
+    """
+    left, right = [cps[0]], [cps[-1]]
+    points = cps
+    while len(points) > 1:
+        points = (1 - t) * points[:-1] + t * points[1:]
+        left.append(points[0])
+        right.append(points[-1])
+
+    return np.array(left), np.array(right[::-1])
+
+def _retag_prefix(component, old_tag, new_tag):
+    """Replace the leading tag in the names of all the panels of the component 
+        (for components naming their panels as <tag>_<role>, e.g. cuffs)
+    """
+    for subs in component._get_subcomponents():
+        if isinstance(subs, pyg.Component):
+            _retag_prefix(subs, old_tag, new_tag)
+        else:
+            subs.name = new_tag + subs.name[len(old_tag):]
+
+
 class PantsHalf(pyg.Component):
     def __init__(self, tag, body, design) -> None:
         super().__init__(tag)
         design = design['pants']
+        measures = pant_measures(body, design)
 
         self.front = PantPanel(
-            f'pant_f_{tag}', body, design
+            f'pant_f_{tag}', body, design, measures
             ).translate_by([0, body['waist_level'] - 5, 25])
         self.back = PantPanel(
-            f'pant_b_{tag}', body, design
+            f'pant_b_{tag}', body, design, measures
             ).translate_by([0, body['waist_level'] - 5, -20])
 
         self.stitching_rules = pyg.Stitches(
@@ -141,9 +208,11 @@ class PantsHalf(pyg.Component):
                     self.front.interfaces['bottom'], self.back.interfaces['bottom'])
 
             # Copy to avoid editing original design dict
-            cdesign = deepcopy(design)
-            cdesign['cuff']['b_width'] = {}
-            cdesign['cuff']['b_width']['v'] = pant_bottom.edges.length() / design['cuff']['top_ruffle']['v']
+            # NOTE: cuffs only read the 'cuff' subtree
+            cdesign = {'cuff': {
+                **design['cuff'], 
+                'b_width': {'v': pant_bottom.edges.length() / design['cuff']['top_ruffle']['v']}
+            }}
 
             # Init
             cuff_class = getattr(bands, cdesign['cuff']['type']['v'])
@@ -169,13 +238,30 @@ class PantsHalf(pyg.Component):
             'top_b': self.back.interfaces['top'],
         }
 
+    def mirrored_copy(self, tag):
+        """Mirror image of the current half under the new tag
+
+            NOTE: the half geometry does not depend on the tag, so copying 
+            is much cheaper than repeating the shape fitting in __init__
+        """
+        new_half = deepcopy(self)
+        old_tag, new_half.name = self.name, tag
+
+        # Panel names: pant_<f/b>_<tag> and <tag>_<cuff panel>
+        for panel in (new_half.front, new_half.back):
+            panel.name = panel.name[:-len(old_tag)] + tag
+        if hasattr(new_half, 'cuff'):
+            _retag_prefix(new_half.cuff, old_tag, tag)
+
+        return new_half.mirror()
+
 class Pants(pyg.Component):
     def __init__(self, body, design) -> None:
         super().__init__('Pants')
 
 
         self.right = PantsHalf('r', body, design)
-        self.left = PantsHalf('l', body, design).mirror()
+        self.left = self.right.mirrored_copy('l')
 
         self.stitching_rules = pyg.Stitches(
             (self.right.interfaces['crotch_f'], self.left.interfaces['crotch_f']),
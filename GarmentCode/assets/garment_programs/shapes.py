@@ -1,45 +1,45 @@
 """A decorative shapes"""
-
+import numpy as np
 
 # Custom
 import pygarment as pyg
 
-def sample_arc(curve, length, stride, n_points, shift=0):
-    ts = [(shift + i*stride) / length for i in range(n_points)]
-    verts = [curve.point(t) for t in ts]
+def sample_arc(start_x, end_x, height, fractions):
+    """Points on the circular arc from [start_x, 0] to [end_x, 0] 
+        passing through [(start_x + end_x) / 2, height]
+
+        * fractions -- array of locations of points as fractions of the arc length
+    """
+    half_w = (end_x - start_x) / 2
+    rad = (half_w**2 + height**2) / (2 * height)
+    c_y = height - rad
 
-    for i in range(len(verts)):
-        verts[i] = [verts[i].real, verts[i].imag]
+    # The arc is symmetric w.r.t. the vertical through the center:
+    # going from angle (pi - end_angle) to end_angle
+    end_angle = np.arctan2(-c_y, half_w)
+    angles = np.pi - end_angle - np.asarray(fractions) * (np.pi - 2 * end_angle)
+
+    return np.column_stack([
+        start_x + half_w + rad * np.cos(angles), 
+        c_y + rad * np.sin(angles)
+    ])
 
-    return verts
 
 def Sun(width, depth, n_rays=8, d_rays=5):
     """Sun-like mark"""
 
-    # Outer arc
-    out_arc = pyg.CircleEdge.from_three_points(
-        [0, 0], [width, 0], [width/2, depth]
-    )
-    in_arc = pyg.CircleEdge.from_three_points(
-        [d_rays, 0], [width - d_rays, 0], [width/2, depth - d_rays]
-    )
-    out_curve = out_arc.as_curve()
-    in_curve = in_arc.as_curve()
-
-    # Sample with stride
-    out_stride = out_arc.length() / n_rays
-    in_stride = in_arc.length() / n_rays
-    
-    out_verts = sample_arc(out_curve, out_arc.length(), out_stride, n_rays, out_stride / 2)
-    in_verts = sample_arc(in_curve, in_arc.length(), in_stride, n_rays + 1, 0)
+    # Rays' tips on the outer arc are shifted by half a stride
+    # w.r.t. the bases on the inner arc
+    out_verts = sample_arc(0, width, depth, (np.arange(n_rays) + 0.5) / n_rays)
+    in_verts = sample_arc(
+        d_rays, width - d_rays, depth - d_rays, np.arange(n_rays + 1) / n_rays)
 
     # Mix the vertices in the right order
-    verts = out_verts
-    for i in range(len(in_verts)):
-        verts.insert(i*2, in_verts[i])
-
-    return pyg.esf.from_verts(*verts)
+    verts = np.empty((2 * n_rays + 1, 2))
+    verts[0::2] = in_verts
+    verts[1::2] = out_verts
 
+    return pyg.esf.from_verts_array(verts)
 
 if __name__ == '__main__':
-    Sun(30, 15)
\ No newline at end of file
+    Sun(30, 15)
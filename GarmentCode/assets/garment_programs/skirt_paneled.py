@@ -2,11 +2,17 @@
 import pygarment as pyg
 from scipy.spatial.transform import Rotation as R
 import numpy as np
+import math
+from copy import deepcopy
+from argparse import Namespace
 
 # other assets
 from .bands import WB
 from .shapes import Sun
 
+# Side-facing orientation of SkirtManyPanels front (shared, Rotation is immutable)
+_SIDE_ROT = R.from_euler('XYZ', [0, -90, 0], degrees=True)
+
 # Panels
 class SkirtPanel(pyg.Panel):
     """One panel of a panel skirt with ruffles on the waist"""
@@ -20,9 +26,10 @@ class SkirtPanel(pyg.Panel):
         x_shift_top = (low_width - top_width) / 2  # to account for flare at the bottom
 
         # define edge loop
-        self.right = pyg.esf.side_with_cut([0,0], [x_shift_top, length], start_cut=bottom_cut / length) if bottom_cut else pyg.EdgeSequence(pyg.Edge([0,0], [x_shift_top, length]))
+        # NOTE: side_with_cut() gives a single edge when there is no cut
+        self.right = pyg.esf.side_with_cut([0,0], [x_shift_top, length], start_cut=bottom_cut / length)
         self.waist = pyg.Edge(self.right[-1].end, [x_shift_top + top_width, length])
-        self.left = pyg.esf.side_with_cut(self.waist.end, [low_width, 0], end_cut=bottom_cut / length) if bottom_cut else pyg.EdgeSequence(pyg.Edge(self.waist.end, [low_width, 0]))
+        self.left = pyg.esf.side_with_cut(self.waist.end, [low_width, 0], end_cut=bottom_cut / length)
         self.bottom = pyg.Edge(self.left[-1].end, self.right[0].start)
         
         # define interface
@@ -33,10 +40,7 @@ class SkirtPanel(pyg.Panel):
             'bottom': pyg.Interface(self, self.bottom)
         }
         # Single sequence for correct assembly
-        self.edges = self.right
-        self.edges.append(self.waist)  # on the waist
-        self.edges.append(self.left)
-        self.edges.append(self.bottom)
+        self.edges = pyg.EdgeSequence(self.right, self.waist, self.left, self.bottom)
 
         # default placement
         self.top_center_pivot()
@@ -73,16 +77,71 @@ class FittedSkirtPanel(pyg.Panel):
         low_angle=0,
         dart_position=None,  dart_frac=0.5,
         cut=0,
-        side_cut=None) -> None:
+        side_cut=None, 
+        outline=None) -> None:
         """
+            * outline -- (optional) pre-computed result of 
+                FittedSkirtPanel.outline() for the same parameters 
+                (checked on use). 
+                Allows to share the shape (and a side cut fit) between 
+                front and back panels. The outline is copied, not consumed
         """
         super().__init__(name)
 
+        params = (waist, hips, hips_depth, length, low_width, rise, low_angle, side_cut)
+        if outline is None:
+            outline = self.outline(*params)
+        elif outline.params != params:
+            raise ValueError(
+                f'{self.__class__.__name__}::Error::Outline was computed for different parameters')
+
+        # adjust for a rise
+        dart_depth = hips_depth * dart_frac
+        dart_depth = max(dart_depth - (hips_depth - outline.adj_hips_depth), 0)
+
+        # NOTE: copy together to keep the references to the edges consistent
+        self.edges, right, top, left, bottom = deepcopy(outline.edges)
+
+        if cut:  # add a cut
+            # Use long and thin disconnected dart for a cutout
+            new_edges, _, int_edges = pyg.ops.cut_into_edge(
+                pyg.esf.dart_shape(2, depth=cut * length),    # 1 cm 
+                bottom, 
+                offset= bottom.length() / 2,
+                right=True)
+
+            self.edges.substitute(bottom, new_edges)
+            bottom = int_edges
+
+        # Default placement
+        self.top_center_pivot()
+        self.translation = [-hips / 2, 5, 0]
+
+        # Out interfaces (easier to define before adding a dart)
+        self.interfaces = {
+            'bottom': pyg.Interface(self, bottom),
+            'right': pyg.Interface(self, right), 
+            'left': pyg.Interface(self, left),  
+        }
+
+        # Add top darts
+        dart_width = outline.w_diff - outline.hw_shift
+        self.add_darts(top, dart_width, dart_depth, dart_position)
+
+
+    @staticmethod
+    def outline(
+            waist, hips, hips_depth, length, low_width, rise=1, 
+            low_angle=0, side_cut=None):
+        """Panel shape before the bottom cut and darts are added
+
+            Returns a namespace with the panel edges as 
+            (edges, right, top, left, bottom), the rise-adjusted measurements 
+            they are built from, and the input parameters
+        """
         # adjust for a rise
         adj_hips_depth = rise * hips_depth
         adj_waist = pyg.utils.lin_interpolation(hips, waist, rise)
-        dart_depth = hips_depth * dart_frac
-        dart_depth = max(dart_depth - (hips_depth - adj_hips_depth), 0)
 
         # amount of extra fabric
         w_diff = hips - adj_waist   # Assume its positive since waist is smaller then hips
@@ -90,7 +149,7 @@ class FittedSkirtPanel(pyg.Panel):
         hw_shift = w_diff / 6
 
         # Adjust the bottom edge to the desired angle
-        angle_shift = np.tan(np.deg2rad(low_angle)) * low_width
+        angle_shift = math.tan(math.radians(low_angle)) * low_width
 
         right = pyg.esf.curve_3_points(
             [hips - low_width, angle_shift],    
@@ -103,19 +162,8 @@ class FittedSkirtPanel(pyg.Panel):
             [hips + low_width, -angle_shift],
             target=[hips * 2, length]
         )
-        self.edges = pyg.EdgeSequence(right, top, left).close_loop()
-        bottom = self.edges[-1]
-
-        if cut:  # add a cut
-            # Use long and thin disconnected dart for a cutout
-            new_edges, _, int_edges = pyg.ops.cut_into_edge(
-                pyg.esf.dart_shape(2, depth=cut * length),    # 1 cm 
-                bottom, 
-                offset= bottom.length() / 2,
-                right=True)
-
-            self.edges.substitute(bottom, new_edges)
-            bottom = int_edges
+        edges = pyg.EdgeSequence.closed(right, top, left)
+        bottom = edges[-1]
 
         if side_cut is not None:
             # Add a stylistic cutout to the skirt
@@ -125,24 +173,16 @@ class FittedSkirtPanel(pyg.Panel):
                 offset=left.length() / 2,   
                 right=True)
 
-            self.edges.substitute(left, new_edges)
+            edges.substitute(left, new_edges)
             left = int_edges
 
-        # Default placement
-        self.top_center_pivot()
-        self.translation = [-hips / 2, 5, 0]
-
-        # Out interfaces (easier to define before adding a dart)
-        self.interfaces = {
-            'bottom': pyg.Interface(self, bottom),
-            'right': pyg.Interface(self, right), 
-            'left': pyg.Interface(self, left),  
-        }
-
-        # Add top darts
-        dart_width = w_diff - hw_shift
-        self.add_darts(top, dart_width, dart_depth, dart_position)
-
+        return Namespace(
+            edges=(edges, right, top, left, bottom),
+            adj_hips_depth=adj_hips_depth,
+            w_diff=w_diff,
+            hw_shift=hw_shift,
+            params=(waist, hips, hips_depth, length, low_width, rise, low_angle, side_cut),
+        )
 
     def add_darts(self, top, dart_width, dart_depth, dart_position):
         
@@ -192,33 +232,37 @@ class PencilSkirt(pyg.Component):
         else:
             style_shape = None
 
+        # Front and back only differ in darts and cuts
+        waist, hips, hips_depth = body['waist'] / 4, body['hips'] / 4, body['hips_line']
+        low_width = design['flare']['v'] * body['hips'] / 4
+        rise, low_angle = design['rise']['v'], design['low_angle']['v']
+        outline = FittedSkirtPanel.outline(
+            waist, hips, hips_depth, length, low_width=low_width,
+            rise=rise, low_angle=low_angle, side_cut=style_shape)
+
         self.front = FittedSkirtPanel(
             f'skirt_f',   
-            body['waist'] / 4, 
-            body['hips'] / 4, 
-            body['hips_line'],
-            length,
-            low_width=design['flare']['v'] * body['hips'] / 4,
-            rise=design['rise']['v'],
-            low_angle=design['low_angle']['v'],
+            waist, hips, hips_depth, length,
+            low_width=low_width,
+            rise=rise,
+            low_angle=low_angle,
             dart_position=body['bust_points'] / 2,
             dart_frac=1.35,  # Diff for front and back
             cut=design['front_cut']['v'], 
-            side_cut=style_shape
+            side_cut=style_shape,
+            outline=outline
         ).translate_to([0, body['waist_level'], 25])
         self.back = FittedSkirtPanel(
             f'skirt_b', 
-            body['waist'] / 4, 
-            body['hips'] / 4,
-            body['hips_line'],
-            length,
-            low_width=design['flare']['v'] * body['hips'] / 4,
-            rise=design['rise']['v'],
-            low_angle=design['low_angle']['v'],
+            waist, hips, hips_depth, length,
+            low_width=low_width,
+            rise=rise,
+            low_angle=low_angle,
             dart_position=body['bum_points'] / 2,
             dart_frac=1.1,   
             cut=design['back_cut']['v'], 
-            side_cut=style_shape
+            side_cut=style_shape,
+            outline=outline
         ).translate_to([0, body['waist_level'], -20])
 
         self.stitching_rules = pyg.Stitches(
@@ -247,22 +291,26 @@ class Skirt2(pyg.Component):
             self.__class__.__name__ if not tag else f'{self.__class__.__name__}_{tag}')
 
         design = design['skirt']
+        length = design['length']['v']
+        ruffle = design['ruffle']['v']   # Only if on waistband
+        flare = design['flare']['v']
+        bottom_cut = design['bottom_cut']['v'] * length
 
         self.front = SkirtPanel(
             f'front_{tag}' if tag else 'front', 
             waist_length=body['waist'], 
-            length=design['length']['v'],
-            ruffles=design['ruffle']['v'],   # Only if on waistband
-            flare=design['flare']['v'],
-            bottom_cut=design['bottom_cut']['v'] * design['length']['v']
+            length=length,
+            ruffles=ruffle,
+            flare=flare,
+            bottom_cut=bottom_cut
         ).translate_to([0, body['waist_level'], 25])
         self.back = SkirtPanel(
             f'back_{tag}'  if tag else 'back', 
             waist_length=body['waist'], 
-            length=design['length']['v'],
-            ruffles=design['ruffle']['v'],   # Only if on waistband
-            flare=design['flare']['v'],
-            bottom_cut=design['bottom_cut']['v'] * design['length']['v']
+            length=length,
+            ruffles=ruffle,
+            flare=flare,
+            bottom_cut=bottom_cut
         ).translate_to([0, body['waist_level'], -20])
 
         self.stitching_rules = pyg.Stitches(
@@ -319,9 +367,8 @@ class SkirtManyPanels(pyg.Component):
         self.front = ThinSkirtPanel('front', panel_w:=waist / n_panels,
                                     bottom_width=panel_w * flare_coeff_pi,
                                     length=length )
-        self.front.translate_to([-waist / 4, body['waist_level'], 0])
         # Align with a body
-        self.front.rotate_by(R.from_euler('XYZ', [0, -90, 0], degrees=True))
+        self.front.transform_to([-waist / 4, body['waist_level'], 0], _SIDE_ROT)
         self.front.rotate_align([-waist / 4, 0, panel_w / 2])
         
         # Create new panels
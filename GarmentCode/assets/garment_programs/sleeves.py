@@ -1,14 +1,15 @@
+import math
 import numpy as np
 from scipy.spatial.transform import Rotation as R
-from scipy.optimize import minimize
-import svgpathtools as svgpath
-from copy import copy, deepcopy
 
 # Custom
 import pygarment as pyg
 from . import bands
 
 # ------  Armhole shapes ------
+# Initial control points of the curved armhole
+_ARMHOLE_CPS = ((0.5, 0.2), (0.8, 0.35))
+
 def ArmholeSquare(incl, width, angle,  invert=True, **kwargs):
     """Simple square armhole cut-out
         Not recommended to use for sleeves, stitching in 3D might be hard
@@ -22,7 +23,7 @@ def ArmholeSquare(incl, width, angle,  invert=True, **kwargs):
     if not invert:
         return edges, None
     
-    sina, cosa = np.sin(angle), np.cos(angle)
+    sina, cosa = math.sin(angle), math.cos(angle)
     l = edges[0].length()
     sleeve_edges = pyg.esf.from_verts(
         [incl + l*sina, - l*cosa], 
@@ -40,7 +41,7 @@ def ArmholeAngle(incl, width, angle, incl_coeff=0.2, w_coeff=0.2,  invert=True,
     if not invert:
         return edges, None
 
-    sina, cosa = np.sin(angle), np.cos(angle)
+    sina, cosa = math.sin(angle), math.cos(angle)
     l = edges[0].length()
     sleeve_edges = pyg.esf.from_verts(
         [diff_incl + l*sina, w_coeff * width - l*cosa], 
@@ -54,7 +55,8 @@ def ArmholeCurve(incl, width, angle, invert=True, **kwargs):
     """ Classic sleeve opening on Cubic Bezier curves
     """
     # Curvature as parameters?
-    cps = [[0.5, 0.2], [0.8, 0.35]]
+    # NOTE: fresh lists -- CurveEdge keeps and updates control points in place
+    cps = [list(cp) for cp in _ARMHOLE_CPS]
     edge = pyg.CurveEdge([incl, width], [0, 0], cps)
     edge_as_seq = pyg.EdgeSequence(edge.reverse())
 
@@ -64,8 +66,8 @@ def ArmholeCurve(incl, width, angle, invert=True, **kwargs):
     # Initialize inverse (initial guess)
     # Agle == 0
     down_direction = np.array([0, -1])  # Full opening is vertically aligned
-    inv_cps = deepcopy(cps)
-    inv_cps[-1][1] *= -1  # Invert the last 
+    # NOTE: cps were reversed in place by edge.reverse() above
+    inv_cps = [cps[0][:], [cps[1][0], -cps[1][1]]]  # Invert the last 
     inv_edge = pyg.CurveEdge(
         start=[incl, width], 
         end=(np.array([incl, width]) + down_direction * edge._straight_len()).tolist(), 
@@ -90,6 +92,14 @@ def ArmholeCurve(incl, width, angle, invert=True, **kwargs):
     return edge_as_seq, pyg.EdgeSequence(fin_inv_edge.reverse())
 
 
+# Armhole shapes available by name in design parameters
+_ARMHOLE_SHAPES = {
+    'ArmholeSquare': ArmholeSquare,
+    'ArmholeAngle': ArmholeAngle,
+    'ArmholeCurve': ArmholeCurve,
+}
+
+
 # -------- New sleeve definitions -------
 
 class SleevePanel(pyg.Panel):
@@ -98,15 +108,16 @@ class SleevePanel(pyg.Panel):
     def __init__(self, name, body, design, open_shape):
         super().__init__(name)
 
-        shoulder_angle = np.deg2rad(body['shoulder_incl'])
-        rest_angle = max(np.deg2rad(design['sleeve_angle']['v']), shoulder_angle)
+        shoulder_angle = math.radians(body['shoulder_incl'])
+        rest_angle = max(math.radians(design['sleeve_angle']['v']), shoulder_angle)
         standing = design['standing_shoulder']['v']
 
         length = design['length']['v']
+        connect_ruffle = design['connect_ruffle']['v']
 
         # Ruffles at opening
-        if not pyg.utils.close_enough(design['connect_ruffle']['v'], 1):
-            open_shape.extend(design['connect_ruffle']['v'])
+        if not pyg.utils.close_enough(connect_ruffle, 1):
+            open_shape.extend(connect_ruffle)
 
         arm_width = abs(open_shape[0].start[1] - open_shape[-1].end[1]) 
         end_width = design['end_width']['v'] * arm_width
@@ -128,8 +139,8 @@ class SleevePanel(pyg.Panel):
             start = top_edge.start
             len = design['standing_shoulder_len']['v']
 
-            x_shift = len * np.cos(rest_angle - shoulder_angle)
-            y_shift = len * np.sin(rest_angle - shoulder_angle)
+            x_shift = len * math.cos(rest_angle - shoulder_angle)
+            y_shift = len * math.sin(rest_angle - shoulder_angle)
 
             standing_edge = pyg.Edge(
                 start=start,
@@ -143,7 +154,7 @@ class SleevePanel(pyg.Panel):
         # Interfaces
         self.interfaces = {
             # NOTE: interface needs reversing because the open_shape was reversed for construction
-            'in': pyg.Interface(self, open_shape, ruffle=design['connect_ruffle']['v']),
+            'in': pyg.Interface(self, open_shape, ruffle=connect_ruffle),
             'out': pyg.Interface(self, self.edges[0], ruffle=design['cuff']['top_ruffle']['v']),
             'top': pyg.Interface(self, self.edges[-2:] if standing else self.edges[-1]),  
             'bottom': pyg.Interface(self, self.edges[1])
@@ -151,12 +162,11 @@ class SleevePanel(pyg.Panel):
 
         # Default placement
         self.set_pivot(self.edges[1].end)
-        self.translate_to(
+        self.transform_to(
             [- body['sholder_w'] / 2,
             body['height'] - body['head_l'] - body['armscye_depth'],
-            0]) 
-        self.rotate_to(R.from_euler(
-            'XYZ', [0, 0, body['arm_pose_angle']], degrees=True))
+            0], 
+            R.from_euler('XYZ', [0, 0, body['arm_pose_angle']], degrees=True))
 
 
 class Sleeve(pyg.Component):
@@ -169,35 +179,42 @@ class Sleeve(pyg.Component):
         design = design['sleeve']
         inclination = design['inclination']['v']
 
-        rest_angle = max(np.deg2rad(design['sleeve_angle']['v']), np.deg2rad(body['shoulder_incl']))
+        rest_angle = max(math.radians(design['sleeve_angle']['v']), math.radians(body['shoulder_incl']))
 
         connecting_width = design['connecting_width']['v']
         smoothing_coeff = design['smoothing_coeff']['v']
+        sleeveless = design['sleeveless']['v']
 
         # --- Define sleeve opening shapes ----
-        armhole = globals()[design['armhole_shape']['v']]
+        armhole = _ARMHOLE_SHAPES[design['armhole_shape']['v']]
         front_project, front_opening = armhole(
             inclination + depth_diff, connecting_width, 
             angle=rest_angle, 
             incl_coeff=smoothing_coeff, 
             w_coeff=smoothing_coeff, 
-            invert=not design['sleeveless']['v']
+            invert=not sleeveless
         )
         
-        back_project, back_opening = armhole(
-            inclination, connecting_width, 
-            angle=rest_angle, 
-            incl_coeff=smoothing_coeff, 
-            w_coeff=smoothing_coeff,
-            invert=not design['sleeveless']['v']
-        )
+        if depth_diff == 0:
+            # NOTE: Same shapes, reuse the fitted ones.
+            # Copies since the edges are modified when building the panels
+            back_project = front_project.copy()
+            back_opening = front_opening.copy() if front_opening is not None else None
+        else:
+            back_project, back_opening = armhole(
+                inclination, connecting_width, 
+                angle=rest_angle, 
+                incl_coeff=smoothing_coeff, 
+                w_coeff=smoothing_coeff,
+                invert=not sleeveless
+            )
         
         self.interfaces = {
             'in_front_shape': pyg.Interface(self, front_project),
             'in_back_shape': pyg.Interface(self, back_project)
         }
 
-        if design['sleeveless']['v']:
+        if sleeveless:
             # The rest is not needed!
             return
         
@@ -235,9 +252,11 @@ class Sleeve(pyg.Component):
         if design['cuff']['type']['v']:
             # Class
             # Copy to avoid editing original design dict
-            cdesign = deepcopy(design)
-            cdesign['cuff']['b_width'] = {}
-            cdesign['cuff']['b_width']['v'] = self.interfaces['out'].edges.length() / design['cuff']['top_ruffle']['v']
+            # NOTE: cuffs only read the 'cuff' subtree
+            cdesign = {'cuff': {
+                **design['cuff'], 
+                'b_width': {'v': self.interfaces['out'].edges.length() / design['cuff']['top_ruffle']['v']}
+            }}
 
             cuff_class = getattr(bands, cdesign['cuff']['type']['v'])
             self.cuff = cuff_class(f'sl_{tag}', cdesign)
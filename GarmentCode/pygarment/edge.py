@@ -1,4 +1,5 @@
 from copy import deepcopy, copy
+import math
 import numpy as np
 from numpy.linalg import norm
 import svgpathtools as svgpath  # https://github.com/mathandy/svgpathtools
@@ -7,6 +8,9 @@ import svgpathtools as svgpath  # https://github.com/mathandy/svgpathtools
 from .generic_utils import vector_angle, R2D, close_enough, c_to_list, list_to_c
 from .flags import VERBOSE
 
+_SQRT1_2 = math.sqrt(0.5)
+
+
 class Edge():
     """Edge -- an individual segement of a panel border connecting two panel vertices, 
      the basic building block of panels
@@ -29,16 +33,26 @@ class Edge():
         # Filled out at the panel assembly time
         self.geometric_id = 0
 
+        self._length_cache = None
+
     # Info
     def length(self):
         """Return current length of an edge.
-            Since vertices may change their locations externally, the length is dynamically evaluated
+            Since vertices may change their locations externally, the length is re-evaluated
+            whenever the vertices differ from the cached state
         """
-        return self._straight_len()
+        key = (*self.start, *self.end)
+        if self._length_cache is None or self._length_cache[0] != key:
+            self._length_cache = (key, self._straight_len())
+
+        return self._length_cache[1]
 
     def _straight_len(self):
         """Length of the edge ignoring the curvature"""
-        return norm(np.asarray(self.end) - np.asarray(self.start))
+        # NOTE: dot() keeps the rounding of norm() (math.hypot() differs in last bits, 
+        # and sleeve shape fitting is sensitive to that)
+        vec = np.array((self.end[0] - self.start[0], self.end[1] - self.start[1]))
+        return math.sqrt(vec.dot(vec))
 
     def __eq__(self, __o: object, tol=1e-2) -> bool:
         """Special implementation of comparison: same edges == edges can be connected by flat stitch
@@ -264,11 +278,19 @@ class CircleEdge(Edge):
         
         self.control_y = cy
 
+        self._length_cache = None
+
     def length(self):
         """Return current length of an edge.
-            Since vertices may change their locations externally, the length is dynamically evaluated
+            Since vertices may change their locations externally, the length is re-evaluated
+            whenever the vertices or the control point differ from the cached state
         """
-        return self._rel_radius() * self._straight_len() * self._arc_angle()
+        key = (*self.start, *self.end, self.control_y)
+        if self._length_cache is None or self._length_cache[0] != key:
+            self._length_cache = (
+                key, self._rel_radius() * self._straight_len() * self._arc_angle())
+
+        return self._length_cache[1]
 
     def __str__(self) -> str:
 
@@ -415,14 +437,19 @@ class CircleEdge(Edge):
             NOTE: Might fail on angles close to 2pi
         """
         # Big or small arc
-        if arc_angle > np.pi:
-            arc_angle = 2*np.pi - arc_angle
+        if arc_angle > math.pi:
+            arc_angle = 2*math.pi - arc_angle
             to_sum = True
         else: 
             to_sum = False
 
-        radius = 1 / np.sin(arc_angle / 2) / 2
-        h = 1 / np.tan(arc_angle / 2) / 2
+        if abs(arc_angle - math.pi / 2) < 1e-9:
+            # NOTE: Quarter of a circle (the most common case): 
+            # radius = 1 / sqrt(2), center is 1/2 away from the chord
+            radius, h = _SQRT1_2, 0.5
+        else:
+            radius = 1 / math.sin(arc_angle / 2) / 2
+            h = 1 / math.tan(arc_angle / 2) / 2
 
         control_y = radius + h if to_sum else radius - h  # relative control point
         control_y *= -1 if right else 1
@@ -436,7 +463,8 @@ class CircleEdge(Edge):
         """
         # Find circle center
         str_dist = norm(np.asarray(end) - np.asarray(start))
-        center_r = np.sqrt(radius**2 - str_dist**2 / 4)
+        # NOTE: clamp round-off errors for half-circle arcs (radius == str_dist / 2)
+        center_r = np.sqrt(max(radius**2 - str_dist**2 / 4, 0))
 
         # Find the absolute value of Y
         control_y = radius + center_r if large_arc else radius - center_r
@@ -468,26 +496,22 @@ class CircleEdge(Edge):
             NOTE: points should not be on the same line
         """
 
-        nstart, nend, npoint_on_arc = np.asarray(start), np.asarray(end), np.asarray(point_on_arc)
+        sx, sy = float(start[0]), float(start[1])
+        ex, ey = float(end[0]), float(end[1])
+        px, py = float(point_on_arc[0]), float(point_on_arc[1])
 
-        # https://stackoverflow.com/a/28910804
-        # Using complex numbers to calculate the center & radius
-        x, y, z = list_to_c([start, point_on_arc, end]) 
-        w = z - x
-        w /= y - x
-        c = (x - y)*(w - abs(w)**2)/2j/w.imag - x
-        # NOTE center = [c.real, c.imag]
-        rad = abs(c + x)
+        _, _, rad = _circle_from_three_points(sx, sy, px, py, ex, ey)
 
         # Large/small arc
-        mid_dist = norm(npoint_on_arc - ((nstart + nend) / 2))
+        mid_dist = math.hypot(px - (sx + ex) / 2, py - (sy + ey) / 2)
 
-        # Orientation
-        angle = vector_angle(npoint_on_arc - nstart, nend - nstart)  # +/-
+        # Orientation: sign of the angle from (point - start) to (end - start)
+        # NOTE: same tolerance as in vector_angle()
+        cross = (px - sx) * (ey - sy) - (py - sy) * (ex - sx)
 
         return CircleEdge.from_points_radius(
             start, end, radius=rad, 
-            large_arc=mid_dist > rad, right=angle > 0) 
+            large_arc=mid_dist > rad, right=cross > -1e-5) 
 
     # Finally
     def assembly(self):
@@ -507,6 +531,21 @@ class CircleEdge(Edge):
             })
 
 
+def _circle_from_three_points(ax, ay, bx, by, cx, cy):
+    """Center and radius of a circle passing through 3 (non-collinear) points
+        given by their scalar coordinates
+
+        https://en.wikipedia.org/wiki/Circumscribed_circle#Cartesian_coordinates_2
+    """
+    a2, b2, c2 = ax*ax + ay*ay, bx*bx + by*by, cx*cx + cy*cy
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+
+    return ux, uy, math.hypot(ax - ux, ay - uy)
+
+
 class CurveEdge(Edge):
     """Curvy edge as Besier curve / B-spline"""
 
@@ -534,11 +573,24 @@ class CurveEdge(Edge):
         if not relative:
             self.control_points = [self._abs_to_rel_2d(c).tolist() for c in self.control_points]
 
+        self._length_cache = None
+        self._midpoint_cache = None
+
+    def _state_key(self):
+        """Current location of vertices and control points (for cache validation)"""
+        return (*self.start, *self.end, *(c for cp in self.control_points for c in cp))
+
     def length(self):
-        """Length of Bezier curve edge"""
-        curve = self.as_curve()
-        
-        return curve.length()
+        """Length of Bezier curve edge
+
+            NOTE: Evaluated numerically, hence the value is cached for the current 
+            location of vertices and control points
+        """
+        key = self._state_key()
+        if self._length_cache is None or self._length_cache[0] != key:
+            self._length_cache = (key, self.as_curve().length())
+
+        return self._length_cache[1]
 
     def __str__(self) -> str:
 
@@ -550,11 +602,18 @@ class CurveEdge(Edge):
         return 'Curve:' + ''.join(str)
     
     def midpoint(self):
-        """Center of the edge"""
-        curve = self.as_curve()
+        """Center of the edge
+
+            NOTE: Evaluated numerically, hence the value is cached for the current 
+            location of vertices and control points
+        """
+        key = self._state_key()
+        if self._midpoint_cache is None or self._midpoint_cache[0] != key:
+            curve = self.as_curve()
+            t_mid = curve.ilength(curve.length()/2)
+            self._midpoint_cache = (key, c_to_list(curve.point(t_mid)))
 
-        t_mid = curve.ilength(curve.length()/2)
-        return c_to_list(curve.point(t_mid))
+        return list(self._midpoint_cache[1])  # Copy: callers may modify the point
     
     def _subdivide(self, fractions: list, by_length=False):
         """Add intermediate vertices to an edge, 
@@ -704,6 +763,24 @@ class EdgeSequence():
         for arg in args:
             self.append(arg)
 
+    @classmethod
+    def single(cls, edge):
+        """Sequence of a single edge object (skips type dispatch of append())"""
+        seq = cls()
+        seq.edges.append(edge)
+        return seq
+
+    @classmethod
+    def closed(cls, *edges):
+        """Loop from the given chained edges: 
+            the closing edge is added if the chain is not closed already
+        """
+        seq = cls(*edges)
+        first, last = seq.edges[0], seq.edges[-1]
+        if len(seq.edges) < 2 or first.start is not last.end:
+            seq.edges.append(Edge(last.end, first.start))
+        return seq
+
     # ANCHOR Properties
     def __getitem__(self, i):
         if isinstance(i, slice):
@@ -725,7 +802,7 @@ class EdgeSequence():
 
     def __contains__(self, item):
         # check presence by comparing references
-        return any([item is e for e in self.edges])
+        return any(item is e for e in self.edges)
 
     def __str__(self) -> str:
         return 'EdgeSeq: ' + str(self.edges)
@@ -801,9 +878,10 @@ class EdgeSequence():
     def insert(self, i, item):
         if isinstance(item, Edge):
             self.edges.insert(i, item)
-        elif isinstance(item, list) or isinstance(item, EdgeSequence):
-            for j in range(len(item)):
-                self.edges.insert(i + j, item[j])
+        elif isinstance(item, EdgeSequence):
+            self.edges[i:i] = item.edges
+        elif isinstance(item, list):
+            self.edges[i:i] = item
         else:
             raise NotImplementedError(f'{self.__class__.__name__}::Error::incerting object of {type(item)} not suported (yet)')
         return self
@@ -838,9 +916,10 @@ class EdgeSequence():
     def translate_by(self, shift):
         """Translate the edge seq vertices s.t. the first vertex is at new_origin
         """
+        dx, dy = float(shift[0]), float(shift[1])
         for v in self.verts():
-            v[0] += shift[0]
-            v[1] += shift[1]
+            v[0] += dx
+            v[1] += dy
         return self
 
     def snap_to(self, new_origin=[0, 0]):
@@ -871,8 +950,11 @@ class EdgeSequence():
         self.snap_to([0, 0])
         rot = R2D(angle)
 
-        for v in self.verts():
-            v[:] = np.matmul(rot, v)
+        # NOTE: vertex objects are shared between edges, so update them in place.
+        # Coordinates are stored as python floats
+        verts = self.verts()
+        for v, new_v in zip(verts, (np.asarray(verts) @ rot.T).tolist()):
+            v[:] = new_v
         
         # recover the original location
         self.snap_to(curr_start)
@@ -909,8 +991,8 @@ class EdgeSequence():
         new_verts = verts_coords - (1 - factor) * verts_projection
 
         # Update vertex objects
-        for i in range(len(verts_coords)):
-            verts_coords[i][:] = new_verts[i]
+        for v, new_v in zip(verts_coords, new_verts.tolist()):
+            v[:] = new_v
 
         return self
 
@@ -927,8 +1009,10 @@ class EdgeSequence():
             ])
         
         # translate -> reflect -> translate back
-        for v in self.verts():
-            v[:] = np.matmul(Ref, np.asarray(v) - v0) + v0
+        verts = self.verts()
+        new_verts = (np.asarray(verts) - v0) @ Ref.T + v0
+        for v, new_v in zip(verts, new_verts.tolist()):
+            v[:] = new_v
 
         # Reflect edge features (curvatures, etc.)
         for e in self.edges:
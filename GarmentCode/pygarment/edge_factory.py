@@ -18,15 +18,31 @@ class EdgeSeqFactory:
         """Generate edge sequence from given vertices. If loop==True, the method also closes the edge sequence as a loop
         """
 
-        seq = EdgeSequence(Edge(verts[0], verts[1]))
-        for i in range(2, len(verts)):
-            seq.append(Edge(seq[-1].end, verts[i]))
-
+        # NOTE: consecutive edges share vertex objects, so the sequence
+        # is chained by construction
+        edges = [Edge(verts[i - 1], verts[i]) for i in range(1, len(verts))]
         if loop:
-            seq.append(Edge(seq[-1].end, seq[0].start))
-        
-        seq.isChained()
-        return seq
+            edges.append(Edge(verts[-1], verts[0]))
+
+        return EdgeSequence(edges)
+
+    @staticmethod
+    def from_verts_array(verts, loop=False):
+        """Generate edge sequence from (N, 2) array of vertices. 
+            If loop==True, the method also closes the edge sequence as a loop
+
+            NOTE: vertex coordinates are stored as python lists of floats, 
+            as with other edge sequences 
+        """
+        return EdgeSeqFactory.from_verts(*np.asarray(verts, dtype=float).tolist(), loop=loop)
+
+    @staticmethod
+    def rect_loop(width, depth):
+        """Rectangular edge loop spanning width over Ox and depth over Oy, 
+            starting from the origin and going up along Oy first
+        """
+        return EdgeSeqFactory.from_verts(
+            [0, 0], [0, depth], [width, depth], [width, 0], loop=True)
 
     @staticmethod
     def from_fractions(start, end, frac=[1]):
@@ -58,6 +74,9 @@ class EdgeSeqFactory:
 
             start_cut and end_cut specify the fraction of the edge to to add extra vertices at
         """
+        if start_cut <= 0 and end_cut <= 0:
+            # No cuts -- a single edge
+            return EdgeSequence.single(Edge(start, end))
 
         nstart, nend = np.array(start), np.array(end)
         verts = [start]
@@ -1,15 +1,51 @@
-from copy import copy
-from numpy.linalg import norm
 import numpy as np
 
 # Custom
 from .edge import Edge, EdgeSequence
 from .generic_utils import close_enough
 
+def _dist2(a, b):
+    """Squared distance between 3D points 
+        (enough for comparing distances, no sqrt needed)
+
+        Works on single points and on arrays of points (..., 3) alike
+    """
+    d = a - b
+    return d[..., 0] * d[..., 0] + d[..., 1] * d[..., 1] + d[..., 2] * d[..., 2]
+
+
+def _flip_edges(s, e, prev_mid, next_mid, first, last):
+    """Whether edges (s -> e) fit better in the reversed direction 
+        between the neighbours' midpoints prev_mid and next_mid
+
+        Works on single edges and on arrays of edges alike (3D points as (..., 3) arrays)
+        * first, last -- mark the edges at the ends of the interface: 
+            they only have the next or the previous neighbour correspondingly
+    """
+    s_prev, s_next = _dist2(s, prev_mid), _dist2(s, next_mid)
+    e_prev, e_next = _dist2(e, prev_mid), _dist2(e, next_mid)
+
+    # Mid case
+    # Utilize distance from the end vertex to the next panel 
+    # start -> prev + end -> next or other way around  
+    # NOTE: sums of distances -- squared values cannot be compared here
+    forward_order_dist = np.sqrt(s_prev) + np.sqrt(e_next)
+    flipped_order_dist = np.sqrt(s_next) + np.sqrt(e_prev)
+
+    # Corener cases: check by start vertex
+    # NOTE this can misfire in particular 3D orentations
+    return np.where(
+        first, s_next < e_next, 
+        np.where(last, s_prev > e_prev, flipped_order_dist < forward_order_dist))
+
+
 class Interface():
     """Description of an interface of a panel or component
         that can be used in stitches as a single unit
     """
+    # NOTE: many interfaces per garment -- no per-instance __dict__
+    __slots__ = ('edges', 'panel', 'edges_flipping', 'ruffle')
+
     def __init__(self, panel, edges, ruffle=1.):
         """
         Parameters:
@@ -20,118 +56,135 @@ class Interface():
         """
 
         self.edges = edges if isinstance(edges, EdgeSequence) else EdgeSequence(edges)
-        self.panel = [panel for _ in range(len(self.edges))]  # matches every edge 
+        n_edges = len(self.edges)
+        self.panel = [panel] * n_edges  # matches every edge 
 
         # Allow to enfoce change the direction of edge 
         # (used in many-to-many stitches correspondance determination)
-        self.edges_flipping = [False for _ in range(len(self.edges))]
+        self.edges_flipping = [False] * n_edges
 
         # Ruffles are applied to sections
         # Since extending a chain of edges != extending each edge individually
-        self.ruffle = [dict(coeff=ruffle, sec=[0, len(self.edges)])]
+        self.ruffle = [dict(coeff=ruffle, sec=[0, n_edges])]
 
     def projecting_edges(self, on_oriented=False) -> EdgeSequence:
         """Return edges shape that should be used when projecting interface onto another panel
             NOTE: reflects current state of the edge object. Call this function again if egdes change (e.g. their direction)
+            NOTE: without ruffles, the interface's own edges are returned (no copy) -- 
+                treat the result as read-only
         """
+        projected = self.oriented_edges() if on_oriented else self.edges
+        if all(close_enough(r['coeff'], 1, 1e-3) for r in self.ruffle):
+            return projected
+
         # Per edge set ruffle application
-        projected = self.edges.copy() if not on_oriented else self.oriented_edges()
+        if projected is self.edges:
+            projected = projected.copy()
         for r in self.ruffle:
             if not close_enough(r['coeff'], 1, 1e-3):
-                projected[r['sec'][0]:r['sec'][1]].extend(1 / r['coeff'])
+                start, end = r['sec']
+                projected[start:end].extend(1 / r['coeff'])
         
         return projected
 
     def needsFlipping(self, i):
-        """ Check if particular edge should be re-oriented to follow the general direction of the interface
-        """
+        """ Check if particular edge should be re-oriented to follow the general direction of the interface"""
         if self.edges_flipping[i]:
             return True
         
         # Otherwise, try to evaluate
-
+        n = len(self.edges)
         e = self.edges[i]
-        panel = self.panel[i]
-        s_3d, end_3d = panel.point_to_3D(e.start), panel.point_to_3D(e.end)
-
-        # Corener cases
-        if i == 0:
-            next, next_panel = self.edges[(i+1 % len(self.edges))], self.panel[(i+1)  % len(self.edges)]
-            next_3d = next_panel.point_to_3D(next.midpoint())
-
-            # check by start vertex
-            # NOTE this can misfire in particular 3D orentations
-            return norm(s_3d - next_3d) < norm(end_3d - next_3d)
-        if i == len(self.edges) - 1:
-            prev, prev_panel = self.edges[i-1], self.panel[i-1]
-            prev_3d = prev_panel.point_to_3D(prev.midpoint())
-
-            # check by start vertex
-            # NOTE this can misfire in particular 3D orentations
-            return norm(s_3d - prev_3d) > norm(end_3d - prev_3d)
+        s_3d, end_3d = self.panel[i].points_to_3D([e.start, e.end])
+        # NOTE: wraps around to the edge itself for single-edge interfaces
+        prev_3d = self.panel[i - 1].point_to_3D(self.edges[i - 1].midpoint())
+        next_3d = self.panel[(i + 1) % n].point_to_3D(self.edges[(i + 1) % n].midpoint())
 
-        # Mid case
-        # Utilize distance from the end vertex to the next panel 
-        # start -> prev + end -> next or other way around  
-        prev, prev_panel = self.edges[i-1], self.panel[i-1]
-        next, next_panel = self.edges[(i+1 % len(self.edges))], self.panel[(i+1)  % len(self.edges)]
-
-        # Optimal order in 3D
-        prev_3d = prev_panel.point_to_3D(prev.midpoint())
-        next_3d = next_panel.point_to_3D(next.midpoint())
-
-        forward_order_dist = norm(s_3d - prev_3d) + norm(end_3d - next_3d)
-        flipped_order_dist = norm(s_3d - next_3d) + norm(end_3d - prev_3d)
-
-        return flipped_order_dist < forward_order_dist
+        return bool(_flip_edges(s_3d, end_3d, prev_3d, next_3d, i == 0, i == n - 1))
 
     # ANCHOR --- Info ----
     def oriented_edges(self):
         """ Orient the edges withing the interface sequence along the general direction of the interface
 
             Creates a copy of the interface s.t. not to disturb the original edge objects
+            NOTE: if no edges need re-orienting, the original edges are returned (no copy) --
+                treat the result as read-only
         """
         # NOTE we cannot we do the same for the edge sub-sequences:
         #  - midpoint of a sequence is less representative
         #  - more likely to have weird relative 3D orientations
         # => heuristic won't work as well
 
-        oriented = self.edges.copy()
+        flips = self._flip_decisions()
+        if not flips.any():
+            return self.edges
 
-        for i in range(len(self.edges)):
-            if self.needsFlipping(i):
-                oriented[i].reverse()
-                oriented[i].flipped = True
-            else:
-                oriented[i].flipped = False
+        oriented = self.edges.copy()
+        for e, flip in zip(oriented, flips):
+            if flip:
+                e.reverse()
+            e.flipped = bool(flip)
         return oriented
 
+    def _flip_decisions(self):
+        """needsFlipping() evaluated for all edges at once (bool array)"""
+        n = len(self.edges)
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+
+        # Start, end and midpoint of every edge in 3D -- one batch per panel
+        per_panel = {}
+        for i, (e, panel) in enumerate(zip(self.edges, self.panel)):
+            _, ids, points = per_panel.setdefault(id(panel), (panel, [], []))
+            ids.append(i)
+            points += [e.start, e.end, e.midpoint()]
+        points_3d = np.empty((n, 3, 3))
+        for panel, ids, points in per_panel.values():
+            points_3d[ids] = panel.points_to_3D(points).reshape(-1, 3, 3)
+        s_3d, end_3d, mid_3d = points_3d[:, 0], points_3d[:, 1], points_3d[:, 2]
+
+        ids = np.arange(n)
+        flips = _flip_edges(
+            s_3d, end_3d, mid_3d[ids - 1], mid_3d[(ids + 1) % n], ids == 0, ids == n - 1)
+
+        return flips | np.asarray(self.edges_flipping, dtype=bool)
+
+    def _verts_per_panel(self):
+        """Unique interface vertices grouped by panel: 
+            list of (panel, ids of vertices in order of appearance, vertices)
+        """
+        # Unique vertex objects (in order of appearance) with their panels
+        verts_2d = {}
+        for e, panel in zip(self.edges, self.panel):
+            verts_2d.setdefault(id(e.start), (e.start, panel))
+            verts_2d.setdefault(id(e.end), (e.end, panel))
+
+        per_panel = {}
+        for i, (v, panel) in enumerate(verts_2d.values()):
+            _, ids, verts = per_panel.setdefault(id(panel), (panel, [], []))
+            ids.append(i)
+            verts.append(v)
+
+        return list(per_panel.values())
+
     def verts_3d(self):
         """Return 3D locations of all vertices that participate in the interface"""
 
-        verts_2d = []
-        matching_panels = []
-        for e, panel in zip(self.edges, self.panel):
-            if all(e.start is not v for v in verts_2d):  # Ensuring uniqueness
-                verts_2d.append(e.start)
-                matching_panels.append(panel)
-            
-            if all(e.end is not v for v in verts_2d):  # Ensuring uniqueness
-                verts_2d.append(e.end)
-                matching_panels.append(panel)
-
-        # To 3D
-        verts_3d = []
-        for v, panel in zip(verts_2d, matching_panels):
-            verts_3d.append(panel.point_to_3D(v))
+        # To 3D: one batch per panel
+        per_panel = self._verts_per_panel()
+        verts_3d = np.empty((sum(len(ids) for _, ids, _ in per_panel), 3))
+        for panel, ids, verts in per_panel:
+            verts_3d[ids] = panel.points_to_3D(verts)
 
-        return np.asarray(verts_3d)
+        return verts_3d
 
     def bbox_3d(self):
         """Return Interface bounding box"""
-        verts = self.verts_3d()
+        # NOTE: vertex order does not matter here
+        batches = [panel.points_to_3D(verts) for panel, _, verts in self._verts_per_panel()]
+        verts = batches[0] if len(batches) == 1 else np.concatenate(batches)
 
-        return [np.min(verts, axis=0), np.max(verts, axis=0)]
+        return [verts.min(axis=0), verts.max(axis=0)]
 
     def __len__(self):
         return len(self.edges)
@@ -140,7 +193,8 @@ class Interface():
         return f'Interface: {[p.name for p in self.panel]}: {str(self.oriented_edges())}'
     
     def __repr__(self) -> str:
-        return self.__str__()
+        # NOTE: no edge orientation evaluation (see __str__()) -- cheap enough for logs and containers
+        return f'Interface: {[p.name for p in self.panel]}: {len(self.edges)} edges'
 
     # ANCHOR --- Interface Updates -----
 
@@ -158,11 +212,9 @@ class Interface():
 
         enum = len(self.edges)
         for r in self.ruffle:
-            # Update ids
-            r['sec'][0] = enum - r['sec'][0]
-            r['sec'][1] = enum - r['sec'][1]
-            # Swap
-            r['sec'][0], r['sec'][1] = r['sec'][1], r['sec'][0]
+            # Update ids & swap (in-place)
+            sec = r['sec']
+            sec[0], sec[1] = enum - sec[1], enum - sec[0]
         
         return self
 
@@ -175,25 +227,17 @@ class Interface():
         
         for i, j in zip(curr_edge_ids, projected_edge_ids):
             for r in self.ruffle:
-                if (i >= r['sec'][0] and i < r['sec'][1] 
-                        and (j < r['sec'][0] or j >= r['sec'][1])):
+                start, end = r['sec']
+                if start <= i < end and not start <= j < end:
                     raise NotImplementedError(
                         f'{self.__class__.__name__}::Error::reordering between panel-related sub-segments is not supported')
         
-        new_edges = EdgeSequence()
-        new_panel_list = []
-        new_flipping_info = []
-        for i in range(len(self.panel)):
-            id = i if i not in curr_edge_ids else projected_edge_ids[curr_edge_ids.index(i)]
-            # edges
-            new_edges.append(self.edges[id])
-            new_flipping_info.append(self.edges_flipping[id])
-            # panels
-            new_panel_list.append(self.panel[id])
-            
-        self.edges = new_edges
-        self.panel = new_panel_list
-        self.edges_flipping = new_flipping_info
+        relocation = dict(zip(curr_edge_ids, projected_edge_ids))
+        new_ids = [relocation.get(i, i) for i in range(len(self.panel))]
+
+        self.edges = EdgeSequence([self.edges[i] for i in new_ids])
+        self.panel = [self.panel[i] for i in new_ids]
+        self.edges_flipping = [self.edges_flipping[i] for i in new_ids]
 
     def substitute(self, orig, new_edges, new_panels):
         """Update the interface edges with correct correction of panels
@@ -212,24 +256,20 @@ class Interface():
         self.edges.substitute(orig, new_edges)
 
         # Update panels & flip info
-        self.panel.pop(orig)
-        self.edges_flipping.pop(orig)
-        if isinstance(new_panels, list) or isinstance(new_panels, tuple):
-            for j in range(len(new_panels)):
-                self.panel.insert(orig + j, new_panels[j])
-                self.edges_flipping.insert(orig + j, False)
-        else: 
-            self.panel.insert(orig, new_panels)
-            self.edges_flipping.insert(orig, False)
+        if not isinstance(new_panels, (list, tuple)):
+            new_panels = [new_panels]
+        self.panel[orig:orig + 1] = new_panels
+        self.edges_flipping[orig:orig + 1] = [False] * len(new_panels)
 
         # Propagate ruffle indicators
         ins_len = 1 if isinstance(new_edges, Edge) else len(new_edges)
         if ins_len > 1:
             for it in self.ruffle:  # UPD ruffle indicators
-                if it['sec'][0] > orig:
-                    it['sec'][0] += ins_len - 1
-                if it['sec'][1] > orig:
-                    it['sec'][1] += ins_len - 1
+                sec = it['sec']
+                if sec[0] > orig:
+                    sec[0] += ins_len - 1
+                if sec[1] > orig:
+                    sec[1] += ins_len - 1
 
         return self
 
@@ -245,21 +285,22 @@ class Interface():
             This order will then be used in the SrtitchingRule when
             determing connectivity between interfaces
         """
-        new_int = copy(ints[0])  # shallow copy -- don't create unnecessary objects
-        new_int.edges = EdgeSequence()
-        new_int.edges_flipping = []
-        new_int.panel = []
-        new_int.ruffle = []
-        
+        panel, flipping, ruffle = [], [], []
+        shift = 0
         for elem in ints:
-            shift = len(new_int.edges)
-            new_int.ruffle += [copy(r) for r in elem.ruffle]
-            for r in new_int.ruffle[-len(elem.ruffle):]:
-                r.update(sec=[r['sec'][0] + shift, r['sec'][1] + shift])
-
-            new_int.edges.append(elem.edges)
-            new_int.panel += elem.panel 
-            new_int.edges_flipping += elem.edges_flipping 
+            # Copy ruffle sections with ids already shifted to the new location
+            ruffle += [
+                dict(r, sec=[r['sec'][0] + shift, r['sec'][1] + shift]) for r in elem.ruffle]
+            panel += elem.panel 
+            flipping += elem.edges_flipping 
+            shift += len(elem.edges)
+
+        # NOTE: all attributes are set below -- skip __init__()
+        new_int = Interface.__new__(Interface)
+        new_int.edges = EdgeSequence(*[elem.edges for elem in ints])
+        new_int.panel = panel
+        new_int.edges_flipping = flipping
+        new_int.ruffle = ruffle
             
         return new_int 
 
@@ -271,4 +312,4 @@ class Interface():
         v1_3d = panel_1.point_to_3D(vert1)
         v2_3d = panel_2.point_to_3D(vert2)
 
-        return norm(v1_3d - s_3d) < norm(v2_3d - s_3d)
+        return _dist2(v1_3d, s_3d) < _dist2(v2_3d, s_3d)
@@ -1,10 +1,12 @@
 """Shortcuts for common operations on panels and components"""
 
 from copy import deepcopy, copy
+import math
 import numpy as np
 from numpy.linalg import norm
 from scipy.spatial.transform import Rotation as R
 from scipy.optimize import minimize
+from scipy.integrate import quad
 import matplotlib.pyplot as plt
 import svgpathtools as svgpath
 
@@ -253,9 +255,14 @@ def _fit_location_edge(shift, location, width_target, curve):
     """Find the points on two curves s.t. vector between them is the same as shortcut"""
 
     # Current points on curves
-    pointc = c_to_np(curve.point(location))   
-    point1 = c_to_np(curve.point(location + shift[0]))
-    point2 = c_to_np(curve.point(location - shift[1]))
+    if isinstance(curve, svgpath.Line):
+        # NOTE: Base edges are mostly straight, evaluate all points in one call
+        points = curve.point(np.array([location, location + shift[0], location - shift[1]]))
+        pointc, point1, point2 = np.column_stack([points.real, points.imag])
+    else:
+        pointc = c_to_np(curve.point(location))   
+        point1 = c_to_np(curve.point(location + shift[0]))
+        point2 = c_to_np(curve.point(location - shift[1]))
 
 
     if flags.VERBOSE:
@@ -271,13 +278,22 @@ def _fit_location_edge(shift, location, width_target, curve):
 def distribute_Y(component, n_copies, odd_copy_shift=10):
     """Distribute copies of component over the circle around Oy"""
     copies = [ component ]
-    delta_rotation = R.from_euler('XYZ', [0, 360 / n_copies, 0], degrees=True)
+
+    # Placement of all the copies at once
+    angles = np.arange(1, n_copies) * (360 / n_copies)
+    rotations = R.from_euler('XYZ', np.column_stack(
+        [np.zeros_like(angles), angles, np.zeros_like(angles)]), degrees=True)
+    translations = np.atleast_2d(rotations.apply(component.translation))
     
     for i in range(n_copies - 1):
-        new_component = deepcopy(copies[-1])
+        new_component = deepcopy(component)
         new_component.name = f'panel_{i}'   # Unique
-        new_component.rotate_by(delta_rotation)
-        new_component.translate_to(delta_rotation.apply(new_component.translation))
+        if hasattr(new_component, 'transform_by'):
+            # Panels: update the placement in one go
+            new_component.transform_by(translations[i] - component.translation, rotations[i])
+        else:
+            new_component.rotate_by(rotations[i])
+            new_component.translate_to(translations[i])
 
         copies.append(new_component)
 
@@ -372,12 +388,49 @@ def even_armhole_openings(front_opening, back_opening, tol=1e-2):
     return front_opening, back_opening
 
 # ANCHOR ----- Curve tools -----
+def _cubic_curvatures(curve, t):
+    """Curvature of the Cubic Bezier curve evaluated at all the parameter values in t at once
+
+        NOTE: follows the operation order of svgpath's curvature() s.t. results are identical
+    """
+    p = curve.bpoints()
+    dz = 3*(p[1] - p[0])*(1 - t)**2 + 6*(p[2] - p[1])*(1 - t)*t + 3*(p[3] - p[2])*t**2
+    ddz = 6*((1 - t)*(p[2] - 2*p[1] + p[0]) + t*(p[3] - 2*p[2] + p[1]))
+    dx, dy = dz.real, dz.imag
+    ddx, ddy = ddz.real, ddz.imag
+
+    # NOTE: vectorized power() may round differently from the scalar pow(), 
+    # and curve_match_tangents() optimization is sensitive to that
+    speed_cubed = [math.pow(v, 3) for v in np.sqrt(dx*dx + dy*dy).tolist()]
+
+    return abs(dx*ddy - dy*ddx) / speed_cubed
+
+def _cubic_length(curve):
+    """Length of the Cubic Bezier curve
+
+        Same integration as svgpath's length(), but the derivative coefficients 
+        are evaluated once rather than in every call of the integrand
+        NOTE: follows the operation order of svgpath's derivative() s.t. results are identical
+    """
+    p = curve.bpoints()
+    d0, d1, d2 = 3*(p[1] - p[0]), 6*(p[2] - p[1]), 3*(p[3] - p[2])
+
+    return quad(
+        lambda t: abs(d0*(1 - t)**2 + d1*(1 - t)*t + d2*t**2), 0, 1, 
+        epsabs=svgpath.path.LENGTH_ERROR, limit=1000)[0]
+
 def _max_curvature(curve, points_estimates=100):
     """Average curvature in a curve"""
     # NOTE: this work slow, but direct evaluation seems
     # infeasible
     # Some hints here: https://math.stackexchange.com/questions/1954845/bezier-curvature-extrema
     t_space = np.linspace(0, 1, points_estimates)
+    if isinstance(curve, svgpath.CubicBezier):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kappa = _cubic_curvatures(curve, t_space)
+        # NOTE: vanishing derivatives need limit evaluation -- use per-point svgpath routine then
+        if np.isfinite(kappa).all():
+            return kappa.max()
     return max([curve.curvature(t) for t in t_space])
 
 def _bend_extend_2_tangent(
@@ -401,7 +454,7 @@ def _bend_extend_2_tangent(
     params = control[:, 0] + 1j*control[:, 1]
     curve_inverse = svgpath.CubicBezier(*params)
 
-    length_diff = (curve_inverse.length() - target_len)**2  # preservation
+    length_diff = (_cubic_length(curve_inverse) - target_len)**2  # preservation
 
     tan_0_diff = (abs(curve_inverse.unit_tangent(0) - target_tangent_start))**2
     tan_1_diff = (abs(curve_inverse.unit_tangent(1) - target_tangent_end))**2
@@ -1,4 +1,5 @@
 
+import math
 import numpy as np
 from copy import copy
 from argparse import Namespace
@@ -24,7 +25,7 @@ class Panel(BaseComponent):
         super().__init__(name)
 
         self.translation = np.zeros(3)
-        self.rotation = R.from_euler('XYZ', [0, 0, 0])  # zero rotation
+        self.rotation = R.identity()  # zero rotation
         # NOTE: initiating with empty sequence allows .append() to it safely
         self.edges =  EdgeSequence() 
 
@@ -71,9 +72,7 @@ class Panel(BaseComponent):
             [top_right[0], mid_y],
             [low_left[0], mid_y]
         ]
-        mid_points_3D = np.vstack(tuple(
-            [self.point_to_3D(coords) for coords in mid_points_2D]
-        ))
+        mid_points_3D = self.points_to_3D(mid_points_2D)
         top_mid_point = mid_points_3D[:, 1].argmax()
 
         self.set_pivot(mid_points_2D[top_mid_point])
@@ -103,6 +102,20 @@ class Panel(BaseComponent):
 
         return self
 
+    def transform_by(self, delta_vector, delta_rotation: R):
+        """Translate and rotate panel in one go
+            * delta_vector: translation vector
+            * delta_rotation: scipy rotation object
+
+            Equivalent to translate_by(delta_vector).rotate_by(delta_rotation),
+            but the panel orientation is updated only once
+        """
+        self.translation = self.translation + np.array(delta_vector)
+        self.rotation = delta_rotation * self.rotation
+        self.autonorm()
+
+        return self
+
     def rotate_to(self, new_rot: R):
         """Set panel rotation to be exactly the given rotation
             * new_rot: scipy rotation object
@@ -114,6 +127,22 @@ class Panel(BaseComponent):
 
         return self
 
+    def transform_to(self, new_translation, new_rot: R):
+        """Set panel translation and rotation to be exactly the given ones
+            * new_translation: translation vector
+            * new_rot: scipy rotation object
+
+            Equivalent to translate_to(new_translation).rotate_to(new_rot),
+            but the panel orientation is updated only once
+        """
+        if not isinstance(new_rot, R):
+            raise ValueError(f'{self.__class__.__name__}::Error::Only accepting rotations in scipy format')
+        self.translation = np.asarray(new_translation)
+        self.rotation = new_rot
+        self.autonorm()
+
+        return self
+
     def rotate_align(self, vector):
         """Set panel rotation s.t. it's norm is aligned with a given 3D vector"""
 
@@ -250,6 +279,19 @@ class Panel(BaseComponent):
 
         return point_3d
 
+    def points_to_3D(self, points_2d):
+        """Calculate 3D locations of a batch of points given in the local 2D plane 
+            (N x 2 or N x 3 array-like)
+        """
+        points_2d = np.asarray(points_2d, dtype=float)
+        points_3d = np.zeros((len(points_2d), 3))
+        points_3d[:, :points_2d.shape[1]] = points_2d
+
+        points_3d = self.rotation.apply(points_3d)
+        points_3d += self.translation
+
+        return points_3d
+
     def norm(self):
         """Normal direction for the current panel"""
 
@@ -265,16 +307,14 @@ class Panel(BaseComponent):
         # To make norm evaluation work for non-convex panels
         # Evalute norm candidates for all edges and then weight them. 
         # The dominant norm direction should be the correct one 
-        norms = []
-        for e in lin_edges:
-            vert_0 = self.point_to_3D(e.start)
-            vert_1 = self.point_to_3D(e.end)
-
-            # Pylance + NP error for unreachanble code -- see https://github.com/numpy/numpy/issues/22146
-            # Works ok for numpy 1.23.4+
-            norm = np.cross(vert_1 - vert_0, center_3d - vert_0)
-            norm /= np.linalg.norm(norm) 
-            norms.append(norm)
+        # NOTE: all edge ends are projected at once
+        starts_3d = self.points_to_3D([e.start for e in lin_edges])
+        ends_3d = self.points_to_3D([e.end for e in lin_edges])
+        # Pylance + NP error for unreachanble code -- see https://github.com/numpy/numpy/issues/22146
+        # Works ok for numpy 1.23.4+
+        crosses = np.cross(ends_3d - starts_3d, center_3d - starts_3d)
+        # NOTE: sqrt(dot()) keeps the rounding of np.linalg.norm() at a fraction of its overhead
+        norms = [c / math.sqrt(c.dot(c)) for c in crosses]
 
         # Current norm direction
         avg_norm = sum(norms) / len(norms)
@@ -292,6 +332,6 @@ class Panel(BaseComponent):
         # Using curve linearization for more accurate approximation of bbox
         lin_edges = EdgeSequence([e.linearize() for e in self.edges])
         verts_2d = lin_edges.verts()
-        verts_3d = np.asarray([self.point_to_3D(v) for v in verts_2d])
+        verts_3d = self.points_to_3D(verts_2d)
 
         return verts_3d.min(axis=0), verts_3d.max(axis=0)